@@ -15,11 +15,20 @@ class OrganizationAdmin(admin.ModelAdmin):
 
 
 class PositionAdmin(admin.ModelAdmin):
-    list_display = ('title', 'is_leadership', 'display_order')
+    list_display = ('title', 'current_holder', 'is_leadership', 'display_order')
     list_filter = ('is_leadership',)
     search_fields = ('title',)
     ordering = ('display_order', 'title')
 
+    def get_queryset(self, request):
+        # Compute the current holder in the changelist query itself instead of
+        # calling Position.get_current_holder once per row
+        return super().get_queryset(request).with_current_holder()
+
+    @admin.display(description='Current holder')
+    def current_holder(self, obj):
+        return obj.current_holder_name or 'Vacant'
+
 
 
 
@@ -32,11 +41,19 @@ class CallingHistoryInline(admin.TabularInline):
     def has_add_permission(self, request, obj=None):
         return False
 
+    def get_queryset(self, request):
+        # The inline formset builds its own queryset, so join changed_by here
+        # rather than relying on the parent admin's prefetch. The JSON
+        # snapshot is not part of the inline's fields, so leave it behind.
+        return super().get_queryset(request).select_related('changed_by').defer('snapshot')
+
 
 class CallingAdmin(admin.ModelAdmin):
     list_display = ('name', 'position', 'organization', 'unit', 'status', 'date_called', 'lcr_updated')
     list_filter = ('status', 'organization', 'unit', 'lcr_updated')
-    search_fields = ('name', 'position__title', 'organization__name', 'unit__name')
+    list_select_related = ('position', 'organization', 'unit')
+    search_fields = ('search_text',)
+    autocomplete_fields = ('unit', 'organization', 'position')
     date_hierarchy = 'date_called'
     inlines = [CallingHistoryInline]
     
@@ -64,14 +81,25 @@ class CallingAdmin(admin.ModelAdmin):
     
     readonly_fields = ('created_at', 'updated_at')
 
+    def get_queryset(self, request):
+        # Wide text columns are not shown on the changelist
+        return super().get_queryset(request).with_admin_fields().defer('notes', 'release_notes')
+
 
 class CallingHistoryAdmin(admin.ModelAdmin):
     list_display = ('calling', 'action', 'member_name', 'changed_by', 'changed_at')
     list_filter = ('action', 'changed_at')
+    # Calling.__str__ renders its position, organization and unit, so join
+    # those through the calling FK as well
+    list_select_related = ('calling__position', 'calling__organization', 'calling__unit', 'changed_by')
     search_fields = ('calling__name', 'changed_by__username', 'notes')
     date_hierarchy = 'changed_at'
     readonly_fields = ('calling', 'action', 'member_name', 'changed_by', 'changed_at', 'notes', 'snapshot')
 
+    def get_queryset(self, request):
+        # The JSON snapshot and notes are only rendered on the detail page
+        return super().get_queryset(request).defer('snapshot', 'notes')
+
 
 # Register models with their admin classes
 admin.site.register(Unit, UnitAdmin)
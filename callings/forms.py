@@ -2,8 +2,22 @@ from django import forms
 from django.forms import ModelForm, DateInput
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
+from django.db.models import Count, Max
 from .models import Unit, Organization, Position, Calling
 
+# Rendered parent-unit choices, keyed by form class so each form can shape
+# its own list. Signal-based invalidation only reaches the process that
+# wrote the Unit, so under multiple gunicorn workers each entry is instead
+# validated against a cheap version stamp on every use: any create, delete
+# or edit moves the row count or the newest updated_at.
+_unit_choice_cache = {}
+
+
+def _unit_choices_version():
+    stamp = Unit.objects.aggregate(n=Count('pk'), latest=Max('updated_at'))
+    return (stamp['n'], stamp['latest'])
+
+
 class UnitForm(ModelForm):
     class Meta:
         model = Unit
@@ -15,7 +29,28 @@ class UnitForm(ModelForm):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['parent_unit'].queryset = Unit.objects.exclude(id=self.instance.id)
+        # Only fetch the columns needed to label the choices, and skip the
+        # self-exclusion query clause entirely for unsaved units
+        field = self.fields['parent_unit']
+        parent_choices = Unit.objects.only('name', 'unit_type')
+        if self.instance.pk:
+            parent_choices = parent_choices.exclude(pk=self.instance.pk)
+        field.queryset = parent_choices
+
+        # Rendering reuses one cached choice list per form class instead of
+        # re-running the full query for every form instance; the version
+        # stamp costs one aggregate query and catches writes from other
+        # processes
+        version = _unit_choices_version()
+        cached = _unit_choice_cache.get(self.__class__)
+        if cached is not None and cached[0] == version:
+            choices = cached[1]
+        else:
+            choices = [(unit.pk, str(unit)) for unit in Unit.objects.only('name', 'unit_type')]
+            _unit_choice_cache[self.__class__] = (version, choices)
+        field.widget.choices = [('', field.empty_label)] + [
+            (pk, label) for pk, label in choices if pk != self.instance.pk
+        ]
 
 class OrganizationForm(ModelForm):
     class Meta:
@@ -63,7 +98,17 @@ class CallingForm(ModelForm):
         self.fields['unit'].required = True
         self.fields['organization'].required = True
         self.fields['position'].required = True
-        
+
+        # unit and home_unit both list Units; materialize the choice list
+        # once and hand it to both widgets — assigning a shared queryset
+        # would not help, since each field clones it and re-runs the query
+        unit_choices = [(unit.pk, str(unit)) for unit in Unit.objects.only('name', 'unit_type')]
+        for field_name in ('unit', 'home_unit'):
+            field = self.fields[field_name]
+            empty = [('', field.empty_label)] if field.empty_label is not None else []
+            field.widget.choices = empty + unit_choices
+
+
         # These fields are not required initially
         self.fields['name'].required = False
         self.fields['date_called'].required = False
@@ -74,18 +119,19 @@ class CallingForm(ModelForm):
             
     def clean(self):
         cleaned_data = super().clean()
-        date_called = cleaned_data.get('date_called')
         date_sustained = cleaned_data.get('date_sustained')
-        date_set_apart = cleaned_data.get('date_set_apart')
-        date_released = cleaned_data.get('date_released')
-        
-        # Validate date order
-        if date_sustained and date_called and date_sustained < date_called:
-            self.add_error('date_sustained', 'Sustained date cannot be before called date')
-            
-        if date_set_apart and date_sustained and date_set_apart < date_sustained:
-            self.add_error('date_set_apart', 'Set apart date cannot be before sustained date')
-            
+
+        # Both order checks hinge on date_sustained, so bail out early and
+        # only look up the other dates when they can actually matter
+        if date_sustained:
+            date_called = cleaned_data.get('date_called')
+            if date_called and date_sustained < date_called:
+                self.add_error('date_sustained', 'Sustained date cannot be before called date')
+
+            date_set_apart = cleaned_data.get('date_set_apart')
+            if date_set_apart and date_set_apart < date_sustained:
+                self.add_error('date_set_apart', 'Set apart date cannot be before sustained date')
+
         return cleaned_data
 
 class CallingReleaseForm(ModelForm):
@@ -130,3 +176,12 @@ class CustomUserCreationForm(UserCreationForm):
         if commit:
             user.save()
         return user
+
+    @classmethod
+    def bulk_save(cls, forms):
+        """
+        Persist a batch of validated forms with a single INSERT instead of
+        one query per user. Each form must already have passed is_valid().
+        """
+        users = [form.save(commit=False) for form in forms]
+        return get_user_model().objects.bulk_create(users)
@@ -1,30 +1,32 @@
 from django.core.management.base import BaseCommand
-from callings.models import Member
+from django.db.utils import NotSupportedError
+from callings.models import Calling
 import re
 
+# Matches names that are actually dates (e.g. '06/29/2025')
+DATE_NAME_PATTERN = r'^\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s*$'
+DATE_NAME_RE = re.compile(DATE_NAME_PATTERN)
+
 class Command(BaseCommand):
-    help = 'Clean up member entries that were incorrectly imported as dates'
+    help = 'Clean up calling entries whose member name was incorrectly imported as a date'
 
     def handle(self, *args, **options):
-        # Find members with names that look like dates (e.g., '06/29/2025')
-        date_pattern = re.compile(r'^\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s*$')
-        
-        # Find all members with date-like names
-        members_to_delete = []
-        for member in Member.objects.all():
-            if date_pattern.match(member.name):
-                members_to_delete.append(member)
-        
-        # Delete the problematic members
-        if members_to_delete:
-            self.stdout.write(f"Found {len(members_to_delete)} members with date-like names to be deleted:")
-            for member in members_to_delete:
-                self.stdout.write(f"- {member.name} (ID: {member.id})")
-            
-            # Delete the members
-            count, _ = Member.objects.filter(
-                id__in=[m.id for m in members_to_delete]
-            ).delete()
-            self.stdout.write(self.style.SUCCESS(f"Successfully deleted {count} members"))
+        try:
+            # Let the database do the matching and delete in a single statement
+            count, _ = Calling.objects.filter(name__regex=DATE_NAME_PATTERN).delete()
+        except NotSupportedError:
+            # Fall back to matching in Python for backends without regex support
+            # Stream id/name pairs in chunks rather than materialising every row
+            ids_to_delete = [
+                calling_id
+                for calling_id, name in Calling.objects.exclude(name__isnull=True)
+                .values_list('id', 'name')
+                .iterator(chunk_size=2000)
+                if DATE_NAME_RE.match(name)
+            ]
+            count, _ = Calling.objects.filter(id__in=ids_to_delete).delete()
+
+        if count:
+            self.stdout.write(self.style.SUCCESS(f"Successfully deleted {count} callings with date-like names"))
         else:
-            self.stdout.write("No members with date-like names found")
+            self.stdout.write("No callings with date-like names found")
@@ -13,8 +13,6 @@ Usage:
 """
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import Group, Permission
-from django.contrib.contenttypes.models import ContentType
-from callings.models import Calling, Unit, Organization, Position
 
 
 class Command(BaseCommand):
@@ -22,13 +20,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         self.stdout.write('Creating permission groups...')
-        
-        # Get content types
-        calling_ct = ContentType.objects.get_for_model(Calling)
-        unit_ct = ContentType.objects.get_for_model(Unit)
-        org_ct = ContentType.objects.get_for_model(Organization)
-        position_ct = ContentType.objects.get_for_model(Position)
-        
+
         # Define groups and their permissions
         groups_config = {
             'Stake President': {
@@ -77,7 +69,14 @@ class Command(BaseCommand):
         
         created_count = 0
         updated_count = 0
-        
+
+        # Fetch every callings permission once and resolve codenames in
+        # memory instead of one SELECT per (group, permission) pair
+        permissions_by_codename = {
+            permission.codename: permission
+            for permission in Permission.objects.filter(content_type__app_label='callings')
+        }
+
         for group_name, config in groups_config.items():
             group, created = Group.objects.get_or_create(name=group_name)
             
@@ -92,24 +91,23 @@ class Command(BaseCommand):
                     self.style.WARNING(f'• Updated group: {group_name}')
                 )
             
-            # Clear existing permissions and add new ones
-            group.permissions.clear()
-            
+            # Resolve the configured codenames against the preloaded map
+            permissions = []
             for perm_codename in config['permissions']:
-                try:
-                    # Try to find permission in callings app models
-                    permission = Permission.objects.get(
-                        codename=perm_codename,
-                        content_type__app_label='callings'
-                    )
-                    group.permissions.add(permission)
-                except Permission.DoesNotExist:
+                permission = permissions_by_codename.get(perm_codename)
+                if permission is not None:
+                    permissions.append(permission)
+                else:
                     self.stdout.write(
                         self.style.ERROR(f'  ✗ Permission not found: {perm_codename}')
                     )
-            
+
+            # set() replaces clear() plus one add() per permission with a
+            # single bulk write
+            group.permissions.set(permissions)
+
             self.stdout.write(
-                f'  Added {group.permissions.count()} permissions to {group_name}'
+                f'  Added {len(permissions)} permissions to {group_name}'
             )
         
         self.stdout.write('')
@@ -1,32 +1,97 @@
 import csv
+import functools
 import os
+import re
+import sys
 from datetime import datetime
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
-from callings.models import Unit, Organization, Position, Member, Calling
+from callings.models import Unit, Organization, Position, Calling
+
+# The default 128k field cap can reject long free-text cells in exports
+csv.field_size_limit(sys.maxsize)
+
+# Compiled once at import: classifiers run on every row of the file
+UNIT_TYPE_RE = re.compile(r'(stake|branch)', re.IGNORECASE)
+LEADERSHIP_RE = re.compile(r'president|bishop|counselor|secretary|clerk|executive', re.IGNORECASE)
+
+# Shape-check regexes dispatch each value straight to the right strptime
+# format instead of trying formats by exception
+DATE_FORMATS = (
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), '%m/%d/%Y'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$'), '%Y-%m-%d'),
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_date(date_str):
+    """Parse date from the formats the export files use.
+
+    Memoized: a file has far fewer distinct dates than date cells, and
+    strptime re-parses its format string on every call.
+    """
+    if not date_str:
+        return None
+    for pattern, date_format in DATE_FORMATS:
+        if pattern.match(date_str):
+            try:
+                return datetime.strptime(date_str, date_format).date()
+            except ValueError:
+                return None
+    return None
+
 
 class Command(BaseCommand):
     help = 'Import callings data from CSV file'
 
+    # Statuses that mean a calling is no longer active
+    INACTIVE_STATUSES = Calling.INACTIVE_STATUSES
+
+    # How many queued rows to hold in memory before flushing to the database
+    BATCH_SIZE = 500
+
     def add_arguments(self, parser):
         parser.add_argument('file_path', type=str, help='Path to the CSV file')
 
     def handle(self, *args, **options):
         file_path = options['file_path']
-        
+
         if not os.path.exists(file_path):
             self.stderr.write(self.style.ERROR(f'File not found: {file_path}'))
             return
 
         # Create or get default units and organizations
         self.create_default_data()
-        
+
+        # Preload lookup caches so repeated names resolve in memory instead of
+        # issuing a get_or_create round-trip for every row
+        self.units = {unit.name: unit for unit in Unit.objects.all()}
+        self.organizations = {org.name: org for org in Organization.objects.all()}
+        self.positions = {position.title: position for position in Position.objects.all()}
+
+        # Index the active callings once so rows resolve against memory, and
+        # collect writes for batched flushes instead of per-row queries
+        self.active_callings = {}
+        self.active_by_member = {}
+        for calling in Calling.objects.filter(date_released__isnull=True).exclude(
+            status__in=self.INACTIVE_STATUSES
+        ):
+            key = (calling.unit_id, calling.organization_id, calling.position_id, calling.name)
+            self.active_callings[key] = calling
+            self.active_by_member[(calling.unit_id, calling.position_id, calling.name)] = calling
+        self.pending_creates = []
+        self.pending_updates = {}
+
+        # One timestamp for the whole run: under USE_TZ every timezone.now()
+        # pays a UTC conversion, and the note is identical for every row
+        self.import_note = f"Imported from CSV on {timezone.now().strftime('%Y-%m-%d')}"
+
         # Track created records
         stats = {
             'units_created': 0,
             'organizations_created': 0,
             'positions_created': 0,
-            'members_created': 0,
             'callings_created': 0,
             'callings_updated': 0,
             'rows_processed': 0,
@@ -35,110 +100,85 @@ class Command(BaseCommand):
 
         current_unit = None
         current_org = None
-        
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
+
+        # One transaction for the whole import: every batch flush commits
+        # together instead of paying a per-statement commit
+        # newline='' is the csv module's recommended mode, and the 1 MiB
+        # buffer keeps read() syscalls rare on large exports
+        with transaction.atomic(), open(file_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as csvfile:
             # Skip the first two rows (header and subheader)
             for _ in range(2):
                 next(csvfile)
-                
+
             # Read the actual header row
             header = next(csv.reader([next(csvfile)]))
-            
+
             # Process the data rows
             for row in csv.reader(csvfile):
                 stats['rows_processed'] += 1
-                
+
                 # Skip empty rows
                 if not any(row):
                     stats['rows_skipped'] += 1
                     continue
-                    
-                # Clean up row data
-                row = [cell.strip() for cell in row]
-                
+
+                # Clean up row data; map runs the strips at C level and the
+                # tuple is cheaper than building a fresh list per row
+                row = tuple(map(str.strip, row))
+
                 # Update current unit if specified
                 if row[0]:  # Unit column
                     current_unit = row[0]
                     current_org = None  # Reset org when unit changes
-                
+
                 # Update current organization if specified
                 if row[1]:  # Organization column
                     current_org = row[1]
-                
+
                 # Skip if we don't have required fields
                 if not current_unit or not current_org or not row[2]:  # Position is required
                     stats['rows_skipped'] += 1
                     continue
-                
+
                 try:
-                    # Get or create unit
-                    unit_name = current_unit
-                    unit, created = Unit.objects.get_or_create(
-                        name=unit_name,
-                        defaults={'unit_type': self.get_unit_type(unit_name)}
-                    )
-                    if created:
-                        stats['units_created'] += 1
-                    
-                    # Get or create organization
-                    org_name = current_org
-                    org, created = Organization.objects.get_or_create(
-                        name=org_name
-                    )
-                    if created:
-                        stats['organizations_created'] += 1
-                    
-                    # Get or create position
-                    position_title = row[2]  # Position column
-                    position, created = Position.objects.get_or_create(
-                        title=position_title,
-                        organization=org,
-                        defaults={
-                            'is_leadership': self.is_leadership_position(position_title)
-                        }
-                    )
-                    if created:
-                        stats['positions_created'] += 1
-                    
-                    # Process member being released (Currently Called column)
-                    released_member_name = row[3] if len(row) > 3 and row[3] else None
-                    if released_member_name:
-                        released_member = self.get_or_create_member(released_member_name, unit)
-                        if released_member is not None:
-                            stats['members_created'] += 1
-                        
-                        # Mark existing calling as released
-                        self.release_existing_calling(unit, position, released_member, stats)
-                    
-                    # Process member being called (Name column)
-                    called_member_name = row[6] if len(row) > 6 and row[6] else None
-                    if called_member_name:
+                    unit = self.get_unit(current_unit, stats)
+                    org = self.get_organization(current_org, stats)
+                    position = self.get_position(row[2], stats)
+
+                    # Member being released (Currently Called column)
+                    released_name = row[3] if len(row) > 3 and row[3] else None
+                    if released_name:
+                        self.release_existing_calling(unit, position, released_name, stats)
+
+                    # Member being called (Name column)
+                    called_name = row[6] if len(row) > 6 and row[6] else None
+                    if called_name:
                         home_unit_name = row[7] if len(row) > 7 and row[7] else None
-                        home_unit = unit  # Default to current unit
-                        
-                        if home_unit_name:
-                            home_unit, _ = Unit.objects.get_or_create(
-                                name=home_unit_name,
-                                defaults={'unit_type': self.get_unit_type(home_unit_name)}
-                            )
-                        
-                        called_member = self.get_or_create_member(called_member_name, home_unit)
-                        if called_member is not None:
-                            stats['members_created'] += 1
-                        
-                        # Create new calling
+                        home_unit = self.get_unit(home_unit_name, stats) if home_unit_name else unit
+
+                        # Queue the new calling
                         self.create_new_calling(
                             unit=unit,
+                            org=org,
                             position=position,
-                            member=called_member,
+                            name=called_name,
+                            home_unit=home_unit,
                             row=row,
                             stats=stats
                         )
-                            
+
                 except Exception as e:
                     self.stderr.write(self.style.ERROR(f"Error processing row {row}: {str(e)}"))
                     stats['rows_skipped'] += 1
-        
+
+                # Flush in fixed-size batches so memory stays bounded no
+                # matter how large the file is
+                if len(self.pending_creates) + len(self.pending_updates) >= self.BATCH_SIZE:
+                    self.flush_pending(stats)
+
+            # Final partial batch, still inside the transaction
+            self.flush_pending(stats)
+
         # Print import statistics
         self.stdout.write(self.style.SUCCESS('\nImport completed!'))
         self.stdout.write(f"Rows processed: {stats['rows_processed']}")
@@ -146,122 +186,130 @@ class Command(BaseCommand):
         self.stdout.write(f"Units created: {stats['units_created']}")
         self.stdout.write(f"Organizations created: {stats['organizations_created']}")
         self.stdout.write(f"Positions created: {stats['positions_created']}")
-        self.stdout.write(f"Members created: {stats['members_created']}")
         self.stdout.write(f"Callings created: {stats['callings_created']}")
         self.stdout.write(f"Callings updated: {stats['callings_updated']}")
-    
+
+    def get_unit(self, unit_name, stats):
+        """Get a unit from the cache, creating it on first sight"""
+        unit = self.units.get(unit_name)
+        if unit is None:
+            unit = Unit.objects.create(
+                name=unit_name,
+                unit_type=self.get_unit_type(unit_name)
+            )
+            self.units[unit_name] = unit
+            stats['units_created'] += 1
+        return unit
+
+    def get_organization(self, org_name, stats):
+        """Get an organization from the cache, creating it on first sight"""
+        org = self.organizations.get(org_name)
+        if org is None:
+            org = Organization.objects.create(name=org_name)
+            self.organizations[org_name] = org
+            stats['organizations_created'] += 1
+        return org
+
+    def get_position(self, position_title, stats):
+        """Get a position from the cache, creating it on first sight"""
+        position = self.positions.get(position_title)
+        if position is None:
+            position = Position.objects.create(
+                title=position_title,
+                is_leadership=self.is_leadership_position(position_title)
+            )
+            self.positions[position_title] = position
+            stats['positions_created'] += 1
+        return position
+
     def get_unit_type(self, unit_name):
         """Determine unit type based on name"""
-        unit_name_lower = unit_name.lower()
-        if 'stake' in unit_name_lower:
-            return 'STAKE'
-        elif 'branch' in unit_name_lower:
-            return 'BRANCH'
+        match = UNIT_TYPE_RE.search(unit_name)
+        if match:
+            return match.group(1).upper()
         return 'WARD'
-    
+
     def is_leadership_position(self, position_title):
         """Determine if a position is a leadership role"""
-        leadership_terms = ['president', 'bishop', 'counselor', 'secretary', 'clerk', 'executive']
-        return any(term in position_title.lower() for term in leadership_terms)
-    
-    def get_or_create_member(self, name, unit):
-        """Get or create a member"""
-        if not name:
-            return None
-            
-        member, created = Member.objects.get_or_create(
-            name=name,
-            defaults={'home_unit': unit}
-        )
-        
-        # Update home unit if it wasn't set
-        if not created and not member.home_unit:
-            member.home_unit = unit
-            member.save()
-            
-        return member
-    
-    def release_existing_calling(self, unit, position, member, stats):
-        """Mark existing calling as released"""
-        if not all([unit, position, member]):
+        return LEADERSHIP_RE.search(position_title) is not None
+
+    def release_existing_calling(self, unit, position, name, stats):
+        """Mark the active calling held by this member as released"""
+        # Short-circuit instead of all([...]), which builds a throwaway list
+        # on every call in the hot loop
+        if not (unit and position and name):
             return
-            
-        # Find and update existing active calling
-        try:
-            calling = Calling.objects.get(
-                unit=unit,
-                position=position,
-                member=member,
-                status='ACTIVE'
-            )
+
+        calling = self.active_by_member.pop((unit.pk, position.pk, name), None)
+        if calling is None:
+            return
+        # The calling is no longer active, so drop it from both caches —
+        # a later row may legitimately call the same member to the same
+        # position again and must not be blocked by the stale entry
+        self.active_callings.pop(
+            (unit.pk, calling.organization_id, position.pk, name), None
+        )
+        if calling.status != 'RELEASED':
             calling.status = 'RELEASED'
-            calling.save()
+            if calling.pk is not None:
+                # Existing row: queue for the batched UPDATE. Unsaved
+                # instances are still in pending_creates and will be
+                # inserted with the released status directly.
+                self.pending_updates[calling.pk] = calling
             stats['callings_updated'] += 1
-        except Calling.DoesNotExist:
-            pass
-    
-    def parse_date(self, date_str):
-        """Parse date from various formats"""
-        if not date_str:
-            return None
-        try:
-            # Try MM/DD/YYYY format first
-            return datetime.strptime(date_str, '%m/%d/%Y').date()
-        except ValueError:
-            try:
-                # Try YYYY-MM-DD format
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
-            except (ValueError, TypeError):
-                return None
-    
-    def create_new_calling(self, unit, position, member, row, stats):
-        """Create a new calling"""
-        if not all([unit, position, member]):
+
+    def create_new_calling(self, unit, org, position, name, home_unit, row, stats):
+        """Queue a new calling for the batched insert"""
+        if not (unit and org and position and name):
             return
-        
-        # Get or create the called_by member (index 11 in the row)
-        called_by_name = row[11] if len(row) > 11 and row[11] else None
-        called_by = None
-        if called_by_name:
-            called_by = self.get_or_create_member(called_by_name, unit)
-            if called_by is not None:
-                stats['members_created'] += 1
-        
-        # Get or create the bishop_consulted_by member (index 9 in the row)
-        bishop_consulted_by_name = row[9] if len(row) > 9 and row[9] else None
-        bishop_consulted_by = None
-        if bishop_consulted_by_name:
-            bishop_consulted_by = self.get_or_create_member(bishop_consulted_by_name, unit)
-            if bishop_consulted_by is not None:
-                stats['members_created'] += 1
-        
-        # Get LCR updated status (last column)
-        lcr_updated = False
-        if row and len(row) > 15 and row[15].strip().upper() == 'TRUE':
-            lcr_updated = True
-        
-        # Create the new calling
-        calling, created = Calling.objects.get_or_create(
+
+        key = (unit.pk, org.pk, position.pk, name)
+        if key in self.active_callings:
+            # Already active (in the database or queued earlier in this file)
+            return
+
+        called_by = row[11] if len(row) > 11 and row[11] else None
+        bishop_consulted_by = row[9] if len(row) > 9 and row[9] else None
+
+        # Get LCR updated status (last column); cells were already stripped
+        lcr_updated = len(row) > 15 and row[15].upper() == 'TRUE'
+
+        calling = Calling(
             unit=unit,
+            organization=org,
             position=position,
-            member=member,
-            status='ACTIVE',
-            defaults={
-                'called_by': called_by,
-                'date_called': self.parse_date(row[5] if len(row) > 5 else None),  # Date column
-                'date_sustained': self.parse_date(row[13] if len(row) > 13 else None),  # Sustained column
-                'date_set_apart': self.parse_date(row[14] if len(row) > 14 else None),  # Set Apart column
-                'presidency_approved': self.parse_date(row[8] if len(row) > 8 else None),  # Presidency Approved column
-                'hc_approved': self.parse_date(row[10] if len(row) > 10 else None),  # HC Approved column
-                'bishop_consulted_by': bishop_consulted_by,
-                'lcr_updated': lcr_updated,
-                'notes': f"Imported from CSV on {timezone.now().strftime('%Y-%m-%d')}"
-            }
+            name=name,
+            status='CALLED',
+            called_by=called_by,
+            date_called=parse_date(row[5] if len(row) > 5 else None),  # Date column
+            date_sustained=parse_date(row[13] if len(row) > 13 else None),  # Sustained column
+            date_set_apart=parse_date(row[14] if len(row) > 14 else None),  # Set Apart column
+            presidency_approved=parse_date(row[8] if len(row) > 8 else None),  # Presidency Approved column
+            hc_approved=parse_date(row[10] if len(row) > 10 else None),  # HC Approved column
+            bishop_consulted_by=bishop_consulted_by,
+            home_unit=home_unit,
+            lcr_updated=lcr_updated,
+            notes=self.import_note
         )
-        
-        if created:
-            stats['callings_created'] += 1
-    
+        # bulk_create bypasses save(), so fill the denormalized column here
+        calling.search_text = calling.build_search_text()
+
+        self.pending_creates.append(calling)
+        self.active_callings[key] = calling
+        self.active_by_member[(unit.pk, position.pk, name)] = calling
+        stats['callings_created'] += 1
+
+    def flush_pending(self, stats):
+        """Write the queued callings in batches instead of one query per row"""
+        if self.pending_creates:
+            Calling.objects.bulk_create(self.pending_creates, batch_size=self.BATCH_SIZE)
+            self.pending_creates = []
+        if self.pending_updates:
+            Calling.objects.bulk_update(
+                self.pending_updates.values(), ['status'], batch_size=self.BATCH_SIZE
+            )
+            self.pending_updates = {}
+
     def create_default_data(self):
         """Create any necessary default data"""
         # Create a default stake unit if it doesn't exist
@@ -1,13 +1,74 @@
 import csv
+import functools
 import os
+import re
+import sys
+from collections import Counter
 from datetime import datetime
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from callings.models import Unit, Organization, Position, Calling
 
+# The default 128k field cap can reject long free-text cells in exports
+csv.field_size_limit(sys.maxsize)
+
+# Shape-check regexes dispatch each value straight to the right strptime
+# format instead of trying formats by exception
+DATE_FORMATS = (
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), '%m/%d/%Y'),
+    (re.compile(r'^\d{1,2}-\d{1,2}-\d{4}$'), '%m-%d-%Y'),
+)
+
+# Cell values that mean "nobody" in the name columns
+SKIP_NAMES = frozenset(('', 'n/a', 'vacant'))
+NA_VALUES = frozenset(('', 'n/a'))
+
+# A member-name cell containing a digit and a date separator is a
+# misaligned date, not a person
+DATE_LIKE_NAME_RE = re.compile(r'\d.*[/-]|[/-].*\d')
+
+LEADERSHIP_ROLES = ('president', 'bishop', 'counselor', 'secretary', 'clerk')
+
+# One pass over the name replaces a chain of lowered substring scans
+UNIT_TYPE_RE = re.compile(r'stake|ward|branch', re.IGNORECASE)
+
+# Column indices the importer actually reads; the rest of each row is
+# never stripped or copied
+USED_COLUMNS = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16)
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_date(date_str):
+    """Parse date from the formats the export files use.
+
+    Memoized: a file has far fewer distinct dates than date cells, and
+    strptime re-parses its format string on every call.
+    """
+    if not date_str:
+        return None
+    for pattern, date_format in DATE_FORMATS:
+        if pattern.match(date_str):
+            try:
+                return datetime.strptime(date_str, date_format).date()
+            except ValueError:
+                return None
+    return None
+
+
 class Command(BaseCommand):
     help = 'Import completed callings from a CSV file'
 
+    # How many queued rows to hold in memory before flushing to the database
+    BATCH_SIZE = 500
+
+    # Fields rewritten on existing callings by the batched update
+    CALLING_UPDATE_FIELDS = [
+        'status', 'date_called', 'date_sustained', 'date_set_apart',
+        'date_released', 'presidency_approved', 'hc_approved', 'lcr_updated',
+        'released_by', 'proposed_replacement', 'home_unit', 'called_by',
+        'bishop_consulted_by', 'notes', 'search_text',
+    ]
+
     def add_arguments(self, parser):
         parser.add_argument('csv_file', type=str, help='Path to the completed callings CSV file')
 
@@ -17,6 +78,10 @@ class Command(BaseCommand):
         if not os.path.exists(csv_file):
             raise CommandError(f'File "{csv_file}" does not exist')
 
+        # Per-row chatter only shows up at -v2; writing to stdout for every
+        # row dominates the run time on large files
+        verbosity = options.get('verbosity', 1)
+
         stats = {
             'rows_processed': 0,
             'rows_skipped': 0,
@@ -26,12 +91,49 @@ class Command(BaseCommand):
             'callings_created': 0,
             'callings_updated': 0,
         }
+        # Skip reasons are tallied here and reported once at the end
+        skip_reasons = Counter()
 
         # Track current unit and org for hierarchical data
         current_unit = None
         current_org = None
 
-        with open(csv_file, 'r', encoding='utf-8-sig') as f:
+        # Prefetch the FK tables in one query each; rows then resolve their
+        # unit/organization/position in memory instead of a get_or_create
+        # round-trip apiece
+        self.units = {unit.name: unit for unit in Unit.objects.all()}
+        self.organizations = {org.name: org for org in Organization.objects.all()}
+        self.positions = {position.title: position for position in Position.objects.all()}
+
+        # Index existing callings by the update_or_create key and collect the
+        # writes so they flush in batches instead of one query per row.
+        # The update path rebuilds search_text, which reads the FK objects,
+        # so join them here rather than lazily once per updated row
+        existing_callings = {}
+        for calling in Calling.objects.select_related('position', 'organization', 'unit'):
+            key = (calling.name, calling.position_id, calling.organization_id, calling.unit_id)
+            existing_callings[key] = calling
+        pending_creates = {}
+        pending_updates = {}
+
+        def flush_pending():
+            """Write the queued callings in fixed-size batches"""
+            if pending_creates:
+                Calling.objects.bulk_create(list(pending_creates.values()), batch_size=self.BATCH_SIZE)
+                # Created rows count as existing for later rows in the file
+                existing_callings.update(pending_creates)
+                pending_creates.clear()
+            if pending_updates:
+                Calling.objects.bulk_update(
+                    list(pending_updates.values()), self.CALLING_UPDATE_FIELDS, batch_size=self.BATCH_SIZE
+                )
+                pending_updates.clear()
+
+        # One transaction for the whole import: every batch flush commits
+        # together instead of paying a per-statement commit.
+        # newline='' is the csv module's recommended mode, and the 1 MiB
+        # buffer keeps read() syscalls rare on large exports
+        with transaction.atomic(), open(csv_file, 'r', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
             reader = csv.reader(f)
             headers = []
             
@@ -45,23 +147,27 @@ class Command(BaseCommand):
             # Expected column count (based on CSV structure)
             expected_columns = 17
             self.stdout.write(f"CSV has {len(headers)} columns, expecting {expected_columns}")
-            
+
             # Print headers for debugging
-            self.stdout.write("Column headers:")
-            for idx, header in enumerate(headers):
-                self.stdout.write(f"  {idx}: {header}")
+            if verbosity >= 2:
+                self.stdout.write("Column headers:")
+                for idx, header in enumerate(headers):
+                    self.stdout.write(f"  {idx}: {header}")
             
             for i, row in enumerate(reader, 1):
                 if not any(row):  # Skip empty rows
                     continue
                 
                 try:
-                    # Convert empty strings to None
-                    row = [cell.strip() if cell.strip() else None for cell in row]
-                    
-                    # Ensure row has enough columns
-                    if len(row) < expected_columns:
-                        row.extend([None] * (expected_columns - len(row)))
+                    # Normalize only the consumed columns: strip each cell,
+                    # convert empty strings to None and pad short rows
+                    cells = row
+                    row = [None] * expected_columns
+                    for idx in USED_COLUMNS:
+                        if idx < len(cells):
+                            cell = cells[idx].strip()
+                            if cell:
+                                row[idx] = cell
                     
                     # Update current unit if this row has one
                     if row[0]:  # Unit column
@@ -73,147 +179,176 @@ class Command(BaseCommand):
                     
                     if not current_unit or not current_org:
                         stats['rows_skipped'] += 1
+                        skip_reasons['no unit/organization'] += 1
                         continue
-                    
-                    # Get or create Unit
-                    unit_type = 'STAKE' if 'stake' in current_unit.lower() else 'WARD' if 'ward' in current_unit.lower() else 'BRANCH'
-                    unit, created = Unit.objects.get_or_create(
-                        name=current_unit,
-                        defaults={'unit_type': unit_type}
-                    )
-                    if created:
-                        stats['units_created'] += 1
-                    
-                    # Get or create Organization
-                    org, created = Organization.objects.get_or_create(name=current_org)
-                    if created:
-                        stats['organizations_created'] += 1
-                    
-                    # Get or create Position
+
+                    unit = self.get_unit(current_unit, stats)
+                    org = self.get_organization(current_org, stats)
+
                     position_title = row[2]  # Position column
                     if not position_title:
                         stats['rows_skipped'] += 1
+                        skip_reasons['no position'] += 1
                         continue
-                        
-                    position, created = Position.objects.get_or_create(
-                        title=position_title,
-                        defaults={'is_leadership': any(role in position_title.lower() for role in ['president', 'bishop', 'counselor', 'secretary', 'clerk'])}
-                    )
-                    if created:
-                        stats['positions_created'] += 1
+
+                    position = self.get_position(position_title, stats)
                     
                     # Get member name (Currently Called)
                     member_name = row[3]  # Currently Called column
                     
                     # Skip rows with empty or invalid member names
-                    if not member_name or member_name.lower().strip() in ['', 'n/a', 'vacant']:
+                    if not member_name or member_name.lower().strip() in SKIP_NAMES:
                         stats['rows_skipped'] += 1
-                        self.stdout.write(f"Skipping row {i}: No member name provided")
+                        skip_reasons['no member name'] += 1
+                        if verbosity >= 2:
+                            self.stdout.write(f"Skipping row {i}: No member name provided")
                         continue
                     
                     # Clean up the member name
                     member_name = member_name.strip()
                     
                     # Skip if the name looks like a date (e.g., '06/29/2025')
-                    if any(c.isdigit() for c in member_name) and any(c in member_name for c in ['/', '-']):
+                    if DATE_LIKE_NAME_RE.search(member_name):
                         stats['rows_skipped'] += 1
-                        self.stdout.write(f"Skipping row {i}: Invalid member name (appears to be a date): {member_name}")
+                        skip_reasons['date-like member name'] += 1
+                        if verbosity >= 2:
+                            self.stdout.write(f"Skipping row {i}: Invalid member name (appears to be a date): {member_name}")
                         continue
-                    
-                    # Parse dates
-                    def parse_date(date_str):
-                        if not date_str:
-                            return None
-                        try:
-                            return datetime.strptime(date_str, '%m/%d/%Y').date()
-                        except (ValueError, TypeError):
-                            try:
-                                return datetime.strptime(date_str, '%m-%d-%Y').date()
-                            except (ValueError, TypeError):
-                                return None
-                    
+
                     # Create or update Calling
                     calling_data = {
-                        'unit': unit,
-                        'organization': org,
-                        'position': position,
-                        'name': member_name,
                         'status': 'COMPLETED',  # Mark as completed
-                        'calling_status': 'RELEASED',  # Mark as released
                         'date_called': parse_date(row[13]),  # Date Called
                         'date_sustained': parse_date(row[14]),  # Sustained
                         'date_set_apart': parse_date(row[15]),  # Set Apart
                         'date_released': parse_date(row[5]),  # Date Released
                         'presidency_approved': parse_date(row[8]),  # Date Approved
                         'hc_approved': parse_date(row[11]),  # Date Approved by HC
-                        'lcr_updated': row[16].lower() == 'true' if row[16] else False,  # LCR Updated
+                        'lcr_updated': (row[16] or '').lower() == 'true',  # LCR Updated
                     }
                     
                     # Handle released_by if available
                     released_by_name = row[4]  # Released By
-                    if released_by_name and released_by_name.lower() not in ['n/a', '']:
+                    if released_by_name and released_by_name.lower() not in NA_VALUES:
                         calling_data['released_by'] = released_by_name.strip()
                     
                     # Handle proposed_replacement if available
                     proposed_replacement_name = row[6]  # Proposed Replacement
-                    if proposed_replacement_name and proposed_replacement_name.lower() not in ['n/a', '']:
+                    if proposed_replacement_name and proposed_replacement_name.lower() not in NA_VALUES:
                         calling_data['proposed_replacement'] = proposed_replacement_name.strip()
                     
-                    # Handle home_unit if available
+                    # Handle home_unit if available; members from the same
+                    # ward repeat constantly, so this hits the unit cache
                     home_unit_name = row[7]  # Home Unit
-                    if home_unit_name and home_unit_name.lower() not in ['n/a', '']:
-                        calling_data['home_unit'] = home_unit_name.strip()
+                    if home_unit_name and home_unit_name.lower() not in NA_VALUES:
+                        calling_data['home_unit'] = self.get_unit(home_unit_name.strip(), stats)
                     
                     # Handle called_by if available
                     called_by_name = row[12]  # To Be Called By
-                    if called_by_name and called_by_name.lower() not in ['n/a', '']:
+                    if called_by_name and called_by_name.lower() not in NA_VALUES:
                         calling_data['called_by'] = called_by_name.strip()
                     
                     # Handle bishop_consulted_by if available
                     bishop_consulted = row[9]  # Bishop To Be Consulted By
-                    if bishop_consulted and bishop_consulted.lower() not in ['n/a', '']:
+                    if bishop_consulted and bishop_consulted.lower() not in NA_VALUES:
                         calling_data['bishop_consulted_by'] = bishop_consulted.strip()
                     
-                    # Build notes from various fields
+                    # Build notes from various fields in one pass
                     notes_parts = ["Imported from completed callings."]
-                    if calling_data.get('released_by'):
-                        notes_parts.append(f"Released by: {calling_data['released_by']}")
-                    if calling_data.get('proposed_replacement'):
-                        notes_parts.append(f"Proposed replacement: {calling_data['proposed_replacement']}")
-                    if calling_data.get('home_unit'):
-                        notes_parts.append(f"Home unit: {calling_data['home_unit']}")
-                    calling_data['notes'] = " ".join(notes_parts)
-                    
-                    # Create or update the calling
-                    calling, created = Calling.objects.update_or_create(
-                        name=member_name,
-                        position=position,
-                        organization=org,
-                        unit=unit,
-                        defaults=calling_data
+                    notes_parts.extend(
+                        f"{label}: {calling_data[field]}"
+                        for label, field in (
+                            ('Released by', 'released_by'),
+                            ('Proposed replacement', 'proposed_replacement'),
+                            ('Home unit', 'home_unit'),
+                        )
+                        if calling_data.get(field)
                     )
+                    calling_data['notes'] = " ".join(notes_parts)
                     
-                    if created:
+                    # Queue the create or update for the batched flush
+                    key = (member_name, position.pk, org.pk, unit.pk)
+                    calling = existing_callings.get(key) or pending_creates.get(key)
+                    if calling is None:
+                        calling = Calling(
+                            name=member_name,
+                            position=position,
+                            organization=org,
+                            unit=unit,
+                            **calling_data
+                        )
+                        # bulk_create bypasses save(), so fill the denormalized column
+                        calling.search_text = calling.build_search_text()
+                        pending_creates[key] = calling
                         stats['callings_created'] += 1
                     else:
+                        for field, value in calling_data.items():
+                            setattr(calling, field, value)
+                        calling.search_text = calling.build_search_text()
+                        if calling.pk is not None:
+                            pending_updates[calling.pk] = calling
                         stats['callings_updated'] += 1
-                    
+
                     stats['rows_processed'] += 1
-                    
-                    if stats['rows_processed'] % 10 == 0:
+
+                    # Flush in fixed-size batches so memory stays bounded
+                    if len(pending_creates) + len(pending_updates) >= self.BATCH_SIZE:
+                        flush_pending()
+
+                    # Progress once per batch rather than every few rows
+                    if stats['rows_processed'] % self.BATCH_SIZE == 0:
                         self.stdout.write(f"Processed {stats['rows_processed']} rows...")
                         
                 except Exception as e:
                     self.stderr.write(f"Error processing row {i}: {e}")
                     stats['rows_skipped'] += 1
+                    skip_reasons['error'] += 1
                     continue
-        
+
+            # Flush the final partial batch, still inside the transaction
+            flush_pending()
+
         # Print summary
         self.stdout.write("\nImport completed!")
         self.stdout.write(f"Rows processed: {stats['rows_processed']}")
         self.stdout.write(f"Rows skipped: {stats['rows_skipped']}")
+        for reason, count in skip_reasons.most_common():
+            self.stdout.write(f"  {reason}: {count}")
         self.stdout.write(f"Units created: {stats['units_created']}")
         self.stdout.write(f"Organizations created: {stats['organizations_created']}")
         self.stdout.write(f"Positions created: {stats['positions_created']}")
         self.stdout.write(f"Callings created: {stats['callings_created']}")
         self.stdout.write(f"Callings updated: {stats['callings_updated']}")
+
+    def get_unit(self, unit_name, stats):
+        """Get a unit from the cache, creating it on first sight"""
+        unit = self.units.get(unit_name)
+        if unit is None:
+            match = UNIT_TYPE_RE.search(unit_name)
+            unit_type = match.group(0).upper() if match else 'BRANCH'
+            unit = Unit.objects.create(name=unit_name, unit_type=unit_type)
+            self.units[unit_name] = unit
+            stats['units_created'] += 1
+        return unit
+
+    def get_organization(self, org_name, stats):
+        """Get an organization from the cache, creating it on first sight"""
+        org = self.organizations.get(org_name)
+        if org is None:
+            org = Organization.objects.create(name=org_name)
+            self.organizations[org_name] = org
+            stats['organizations_created'] += 1
+        return org
+
+    def get_position(self, position_title, stats):
+        """Get a position from the cache, creating it on first sight"""
+        position = self.positions.get(position_title)
+        if position is None:
+            title_lower = position_title.lower()
+            position = Position.objects.create(
+                title=position_title,
+                is_leadership=any(role in title_lower for role in LEADERSHIP_ROLES)
+            )
+            self.positions[position_title] = position
+            stats['positions_created'] += 1
+        return position
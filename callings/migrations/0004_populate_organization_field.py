@@ -1,5 +1,15 @@
+import re
+
 from django.db import migrations
 
+# Strip the "(Organization)" context and "#N" suffixes that later dedup
+# passes append, so decorated title variants still hit the mapping
+TITLE_SUFFIX_RE = re.compile(r'\s*\([^)]*\)\s*#?\d*$')
+
+
+def normalize_title(title):
+    return TITLE_SUFFIX_RE.sub('', title).strip().lower()
+
 
 def populate_organization_field(apps, schema_editor):
     """
@@ -88,36 +98,57 @@ def populate_organization_field(apps, schema_editor):
         'Welfare Specialist': 'Welfare',
     }
     
-    # Get all organizations
-    organizations = {org.name: org for org in Organization.objects.all()}
-    
-    # Get all callings that need organization assignment
-    callings_needing_org = Calling.objects.filter(organization__isnull=True)
-    
+    # Get all organization pks; instances are never needed, only the FK value
+    organizations = {org.name: org.pk for org in Organization.objects.all()}
+
+    # Normalize the mapping keys once so a case or suffix variant of a title
+    # still resolves instead of falling through to the default organization
+    normalized_mapping = {
+        normalize_title(title): org_name
+        for title, org_name in position_to_org_mapping.items()
+    }
+
+    # Join position in the same query so reading its title doesn't lazily
+    # fetch one Position per calling; iterate with a server-side cursor so
+    # only one chunk of rows is resident at a time
+    callings_needing_org = Calling.objects.filter(organization__isnull=True).select_related(
+        'position'
+    ).only('id', 'organization', 'position__title').iterator(chunk_size=2000)
+
+    # Resolve the fallback organization once instead of re-checking per row
+    default_org_name = "General Ward"
+    default_org_pk = organizations.get(default_org_name)
+    to_update = []
+    updated = 0
+
     for calling in callings_needing_org:
-        position_title = calling.position.title
-        
         # Try to find a matching organization
-        org_name = position_to_org_mapping.get(position_title)
-        
-        if org_name and org_name in organizations:
-            calling.organization = organizations[org_name]
-            calling.save()
-            print(f"Assigned {position_title} to {org_name}")
-        else:
-            # If no specific mapping found, try to create a generic organization
-            # or assign to a default one
-            default_org_name = "General Ward"
-            if default_org_name not in organizations:
-                default_org = Organization.objects.create(
+        org_name = normalized_mapping.get(normalize_title(calling.position.title))
+        org_pk = organizations.get(org_name) if org_name else None
+
+        if org_pk is None:
+            # If no specific mapping found, assign to the default
+            # organization, creating it on first use
+            if default_org_pk is None:
+                default_org_pk = Organization.objects.create(
                     name=default_org_name,
                     description="General ward organization for positions not assigned to specific organizations"
-                )
-                organizations[default_org_name] = default_org
-            
-            calling.organization = organizations[default_org_name]
-            calling.save()
-            print(f"Assigned {position_title} to default organization: {default_org_name}")
+                ).pk
+            org_pk = default_org_pk
+
+        calling.organization_id = org_pk
+        to_update.append(calling)
+
+        # Flush alongside the read cursor so memory stays bounded
+        if len(to_update) >= 2000:
+            Calling.objects.bulk_update(to_update, ['organization'], batch_size=500)
+            updated += len(to_update)
+            to_update = []
+
+    # Final partial batch
+    Calling.objects.bulk_update(to_update, ['organization'], batch_size=500)
+    updated += len(to_update)
+    print(f"Assigned organizations to {updated} callings")
 
 
 def reverse_populate_organization_field(apps, schema_editor):
@@ -8,51 +8,68 @@ def make_position_titles_unique(apps, schema_editor):
     """
     Position = apps.get_model('callings', 'Position')
     Calling = apps.get_model('callings', 'Calling')
-    
+
+    # Every uniqueness probe below runs against this in-memory set instead of
+    # an exists() query per candidate title
+    existing_titles = set(Position.objects.values_list('title', flat=True))
+
     # Get all duplicate position titles
-    duplicates = Position.objects.values('title').annotate(count=Count('id')).filter(count__gt=1)
-    
-    for duplicate in duplicates:
-        title = duplicate['title']
-        positions = Position.objects.filter(title=title)
-        
+    duplicate_titles = list(
+        Position.objects.values('title').annotate(count=Count('id'))
+        .filter(count__gt=1).values_list('title', flat=True)
+    )
+
+    # Fetch every duplicated position in one query and group them in Python
+    positions_by_title = {}
+    for position in Position.objects.filter(title__in=duplicate_titles).order_by('id'):
+        positions_by_title.setdefault(position.title, []).append(position)
+
+    # One query gives the organization context of the first calling per
+    # position (first in the model's default -date_called order)
+    sample_orgs = {}
+    for position_id, org_name in Calling.objects.filter(
+        position__title__in=duplicate_titles
+    ).values_list('position_id', 'organization__name'):
+        sample_orgs.setdefault(position_id, org_name)
+
+    to_update = []
+
+    for title, positions in positions_by_title.items():
         # For each duplicate position, try to make it unique based on associated callings
         for i, position in enumerate(positions):
             if i == 0:
                 # Keep the first one as is
                 continue
-            
-            # Get a sample calling for this position to determine organization context
-            sample_calling = Calling.objects.filter(position=position).first()
-            
-            if sample_calling and sample_calling.organization:
+
+            org_name = sample_orgs.get(position.id)
+
+            if org_name:
                 # Update the position title to include organization context
-                new_title = f"{title} ({sample_calling.organization.name})"
-                
+                new_title = f"{title} ({org_name})"
+
                 # Check if this new title already exists
                 counter = 1
                 original_new_title = new_title
-                while Position.objects.filter(title=new_title).exists():
+                while new_title in existing_titles:
                     new_title = f"{original_new_title} #{counter}"
                     counter += 1
-                
-                position.title = new_title
-                position.save()
-                print(f"Updated position title: '{title}' -> '{new_title}'")
             else:
                 # If no organization context, just add a number
                 new_title = f"{title} #{i}"
-                
+
                 # Check if this new title already exists
                 counter = 1
-                original_new_title = new_title
-                while Position.objects.filter(title=new_title).exists():
+                while new_title in existing_titles:
                     new_title = f"{title} #{counter}"
                     counter += 1
-                
-                position.title = new_title
-                position.save()
-                print(f"Updated position title: '{title}' -> '{new_title}'")
+
+            position.title = new_title
+            existing_titles.add(new_title)
+            to_update.append(position)
+
+    # One batched UPDATE instead of a save() per renamed position
+    Position.objects.bulk_update(to_update, ['title'], batch_size=500)
+    print(f"Renamed {len(to_update)} duplicate position titles")
 
 
 def reverse_make_position_titles_unique(apps, schema_editor):
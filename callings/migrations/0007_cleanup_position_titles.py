@@ -1,6 +1,10 @@
 from django.db import migrations
 import re
 
+# Pattern to match titles with organization context in parentheses
+# Example: "1st Counselor (General Ward)" or "Executive Secretary (Bishopric) #1"
+CLEAN_TITLE_RE = re.compile(r'^(.+?)\s*\([^)]+\)(?:\s*#\d+)?$')
+
 
 def cleanup_position_titles(apps, schema_editor):
     """
@@ -8,37 +12,41 @@ def cleanup_position_titles(apps, schema_editor):
     that were added during the decoupling migration.
     """
     Position = apps.get_model('callings', 'Position')
-    
-    # Pattern to match titles with organization context in parentheses
-    # Example: "1st Counselor (General Ward)" or "Executive Secretary (Bishopric) #1"
-    pattern = r'^(.+?)\s*\([^)]+\)(?:\s*#\d+)?$'
-    
-    for position in Position.objects.all():
+
+    # All uniqueness checks run against this set, maintained as titles are
+    # rewritten, instead of an exists() query per probe
+    titles = set(Position.objects.values_list('title', flat=True))
+    to_update = []
+
+    for position in Position.objects.only('id', 'title').iterator(chunk_size=500):
         original_title = position.title
-        match = re.match(pattern, original_title)
-        
-        if match:
-            # Extract the base title without organization context
-            base_title = match.group(1).strip()
-            
-            # Check if this base title already exists
-            if Position.objects.filter(title=base_title).exists():
-                # If it exists, we need to keep it unique but make it cleaner
-                # We'll use just a number suffix without organization context
-                counter = 1
+        match = CLEAN_TITLE_RE.match(original_title)
+        if not match:
+            continue
+
+        # Extract the base title without organization context
+        base_title = match.group(1).strip()
+
+        if base_title in titles:
+            # If it exists, we need to keep it unique but make it cleaner —
+            # just a number suffix without organization context
+            counter = 1
+            new_title = f"{base_title} {counter}"
+            while new_title in titles:
+                counter += 1
                 new_title = f"{base_title} {counter}"
-                while Position.objects.filter(title=new_title).exists():
-                    counter += 1
-                    new_title = f"{base_title} {counter}"
-                
-                position.title = new_title
-                position.save()
-                print(f"Updated: '{original_title}' -> '{new_title}'")
-            else:
-                # No conflict, use the clean base title
-                position.title = base_title
-                position.save()
-                print(f"Cleaned: '{original_title}' -> '{base_title}'")
+        else:
+            # No conflict, use the clean base title
+            new_title = base_title
+
+        position.title = new_title
+        titles.discard(original_title)
+        titles.add(new_title)
+        to_update.append(position)
+
+    # One batched UPDATE instead of a save() per cleaned title
+    Position.objects.bulk_update(to_update, ['title'], batch_size=500)
+    print(f"Cleaned up {len(to_update)} position titles")
 
 
 def reverse_cleanup_position_titles(apps, schema_editor):
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-08-29 09:55
+
+from django.db import migrations, models
+
+
+def populate_search_text(apps, schema_editor):
+    """Backfill the denormalized search column for existing callings."""
+    Calling = apps.get_model('callings', 'Calling')
+
+    batch = []
+    queryset = Calling.objects.select_related('position', 'organization', 'unit')
+    for calling in queryset.iterator(chunk_size=500):
+        calling.search_text = ' '.join(filter(None, [
+            calling.name,
+            calling.position.title if calling.position_id else None,
+            calling.organization.name if calling.organization_id else None,
+            calling.unit.name if calling.unit_id else None,
+        ]))
+        batch.append(calling)
+        if len(batch) >= 500:
+            Calling.objects.bulk_update(batch, ['search_text'])
+            batch = []
+    if batch:
+        Calling.objects.bulk_update(batch, ['search_text'])
+
+
+def reverse_populate_search_text(apps, schema_editor):
+    """Reverse operation - clear the denormalized column"""
+    Calling = apps.get_model('callings', 'Calling')
+    Calling.objects.update(search_text='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callings', '0016_add_database_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calling',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Denormalized copy of name, position, organization and unit for admin search'),
+        ),
+        migrations.RunPython(
+            populate_search_text,
+            reverse_populate_search_text,
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-08-29 09:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callings', '0017_add_calling_search_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calling',
+            index=models.Index(fields=['date_called'], name='calling_date_called_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='callinghistory',
+            index=models.Index(fields=['changed_at'], name='history_changed_at_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-08-29 10:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callings', '0018_add_date_hierarchy_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calling',
+            index=models.Index(fields=['name', 'position', 'organization', 'unit'], name='calling_import_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='unit',
+            index=models.Index(fields=['name'], name='unit_name_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-08-29 10:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callings', '0019_add_import_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calling',
+            index=models.Index(fields=['position', 'is_active', 'status'], name='calling_pos_active_status_idx'),
+        ),
+    ]
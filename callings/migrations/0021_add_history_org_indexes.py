@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-08-29 10:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callings', '0020_add_position_holder_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='callinghistory',
+            index=models.Index(fields=['changed_by', '-changed_at'], name='history_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['unit', 'is_active'], name='org_unit_active_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-08-29 10:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callings', '0021_add_history_org_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='calling',
+            name='calling_released_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='calling',
+            name='calling_lcr_idx',
+        ),
+        migrations.AddIndex(
+            model_name='calling',
+            index=models.Index(condition=models.Q(('date_released__isnull', False)), fields=['date_released'], name='calling_released_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='calling',
+            index=models.Index(condition=models.Q(('lcr_updated', False)), fields=['lcr_updated'], name='calling_lcr_pending_idx'),
+        ),
+    ]
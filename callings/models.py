@@ -1,4 +1,7 @@
+import functools
+
 from django.db import models
+from django.db.models.functions import Concat
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.urls import reverse
 from django.utils import timezone
@@ -7,6 +10,17 @@ from django.conf import settings
 # Use the custom User model
 User = settings.AUTH_USER_MODEL
 
+
+@functools.cache
+def _detail_url_template(url_name):
+    """Resolve a pk-keyed detail route once and reuse it as a format string.
+
+    reverse() walks the URLconf patterns on every call, which adds up when
+    a list page builds one URL per row. The cache is keyed by route name,
+    so tests that override the URLconf still resolve on first use.
+    """
+    return reverse(url_name, kwargs={'pk': 0}).replace('/0/', '/{pk}/')
+
 class Unit(models.Model):
     UNIT_TYPES = [
         ('WARD', 'Ward'),
@@ -29,6 +43,17 @@ class Unit(models.Model):
 
     class Meta:
         ordering = ['sort_order', 'name']
+        indexes = [
+            # The import commands resolve units by name for every row
+            models.Index(fields=['name'], name='unit_name_idx'),
+        ]
+
+    # Built once at class load; __str__ runs for every rendered row and
+    # Django's get_unit_type_display rebuilds the choices dict each call
+    UNIT_TYPE_DISPLAY = dict(UNIT_TYPES)
+
+    def get_unit_type_display(self):
+        return self.UNIT_TYPE_DISPLAY.get(self.unit_type, self.unit_type)
 
     def __str__(self):
         unit_type_display = self.get_unit_type_display()
@@ -48,7 +73,7 @@ class Unit(models.Model):
         ]
     
     def get_absolute_url(self):
-        return reverse('callings:unit-detail', kwargs={'pk': self.pk})
+        return _detail_url_template('callings:unit-detail').format(pk=self.pk)
 
 
 class Organization(models.Model):
@@ -62,10 +87,14 @@ class Organization(models.Model):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            # Unit pages list their active organizations
+            models.Index(fields=['unit', 'is_active'], name='org_unit_active_idx'),
+        ]
 
     def __str__(self):
         return self.name
-    
+
     def get_list_display(self):
         return [
             self.name,
@@ -75,7 +104,24 @@ class Organization(models.Model):
         ]
     
     def get_absolute_url(self):
-        return reverse('callings:organization-detail', kwargs={'pk': self.pk})
+        return _detail_url_template('callings:organization-detail').format(pk=self.pk)
+
+
+class PositionQuerySet(models.QuerySet):
+    def with_current_holder(self):
+        """Annotate each position with its current holder's name.
+
+        List pages read the annotation through get_current_holder, turning
+        one query per rendered row into a subquery in the list query itself.
+        """
+        active_callings = Calling.objects.filter(
+            position=models.OuterRef('pk'),
+            is_active=True,
+            date_released__isnull=True,
+        ).exclude(status__in=Calling.INACTIVE_STATUSES).order_by('-date_called', 'pk')
+        return self.annotate(
+            current_holder_name=models.Subquery(active_callings.values('name')[:1])
+        )
 
 
 class Position(models.Model):
@@ -94,22 +140,25 @@ class Position(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PositionQuerySet.as_manager()
+
     class Meta:
         ordering = ['display_order', 'title']
 
     def __str__(self):
         return self.title
-    
+
     def get_current_holder(self):
         """Get the current holder of this position"""
+        # Served from the with_current_holder annotation when present
+        if hasattr(self, 'current_holder_name'):
+            return self.current_holder_name
         # Find callings that are not completed, cancelled, LCR updated, or released
         # and don't have a release date
         active_calling = self.callings.filter(
             is_active=True,
             date_released__isnull=True
-        ).exclude(
-            status__in=['COMPLETED', 'CANCELLED', 'LCR_UPDATED', 'RELEASED']
-        ).first()
+        ).exclude(status__in=Calling.INACTIVE_STATUSES).first()
         return active_calling.name if active_calling else None
     
     def get_list_display(self):
@@ -121,8 +170,72 @@ class Position(models.Model):
         ]
     
     def get_absolute_url(self):
-        return reverse('callings:position-detail', kwargs={'pk': self.pk})
+        return _detail_url_template('callings:position-detail').format(pk=self.pk)
+
+
+
+class CallingQuerySet(models.QuerySet):
+    def with_display_name(self):
+        """Annotate get_display_name's result, computed in SQL.
+
+        Rows carrying the annotation skip the per-row branch and string
+        concatenation in Python when lists render the (N/R) suffix.
+        """
+        return self.annotate(
+            display_name=models.Case(
+                models.When(name__isnull=True, then=models.F('name')),
+                models.When(name='', then=models.F('name')),
+                models.When(
+                    date_released__isnull=True,
+                    then=Concat(models.F('name'), models.Value(' (N/R)')),
+                ),
+                default=models.F('name'),
+                output_field=models.CharField(),
+            )
+        )
+
+    def with_display(self):
+        """Joins every FK that __str__ and get_list_display read.
+
+        Any view that renders callings should start from this so a page of
+        rows costs one query instead of three lookups per row.
+        """
+        return self.select_related('position', 'organization', 'unit')
+
+    def for_rendering(self):
+        """Rows as the list templates consume them: display joins, wide
+        text columns left behind.
 
+        The templates call model methods per row (URLs, badges, display
+        names), so rows stay model instances rather than values() dicts;
+        skipping the text columns trims the hydration cost without
+        breaking that contract.
+        """
+        return self.with_display().with_display_name().defer(
+            'notes',
+            'release_notes',
+            'search_text',
+            'position__description',
+            'organization__description',
+        )
+
+    def set_status(self, status, **extra_fields):
+        """Apply a status transition to every matched row in one UPDATE.
+
+        update() bypasses save() and auto_now, so updated_at is written
+        explicitly. Callers that need an audit trail should build the
+        CallingHistory rows themselves and pass them to log_many.
+        """
+        return self.update(status=status, updated_at=timezone.now(), **extra_fields)
+
+    def with_admin_fields(self):
+        """Joins and prefetches needed to render a calling with its history."""
+        return self.with_display().prefetch_related(
+            models.Prefetch(
+                'history',
+                queryset=CallingHistory.objects.select_related('changed_by').defer('snapshot'),
+            )
+        )
 
 
 class Calling(models.Model):
@@ -134,7 +247,19 @@ class Calling(models.Model):
         ('CALLED', 'Called'),
         ('LCR_UPDATED', 'LCR Updated'),
     ]
-    
+
+    # Statuses that close out a calling record entirely. Kept as exclude()
+    # lists rather than a positive filter because production data carries
+    # status values (COMPLETED, CANCELLED, RELEASED among them) that
+    # predate the current STATUS_CHOICES.
+    CLOSED_STATUSES = ('COMPLETED', 'LCR_UPDATED', 'CANCELLED')
+    # A released member no longer holds the position either
+    INACTIVE_STATUSES = CLOSED_STATUSES + ('RELEASED',)
+
+    # Flattened once; Django's get_status_display rebuilds the choices
+    # dict on every call
+    STATUS_DISPLAY = dict(STATUS_CHOICES)
+
     # Core relationships - all required
     unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='callings')
     organization = models.ForeignKey(Organization, on_delete=models.PROTECT, related_name='callings')
@@ -203,10 +328,16 @@ class Calling(models.Model):
         help_text="Whether this calling has been synced with LCR"
     )
     notes = models.TextField(
-        blank=True, 
+        blank=True,
         null=True,
         help_text="Additional notes about the calling"
     )
+    search_text = models.TextField(
+        blank=True,
+        default='',
+        editable=False,
+        help_text="Denormalized copy of name, position, organization and unit for admin search"
+    )
     release_notes = models.TextField(
         blank=True, 
         null=True,
@@ -215,6 +346,8 @@ class Calling(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CallingQuerySet.as_manager()
+
     class Meta:
         ordering = ['-date_called']
         verbose_name_plural = 'Callings'
@@ -223,8 +356,31 @@ class Calling(models.Model):
             models.Index(fields=['unit', 'status'], name='calling_unit_status_idx'),
             models.Index(fields=['organization', 'status'], name='calling_org_status_idx'),
             models.Index(fields=['is_active', 'status'], name='calling_active_status_idx'),
-            models.Index(fields=['date_released'], name='calling_released_idx'),
-            models.Index(fields=['lcr_updated'], name='calling_lcr_idx'),
+            # Position.get_current_holder filters by position + is_active and
+            # then narrows on status
+            models.Index(fields=['position', 'is_active', 'status'], name='calling_pos_active_status_idx'),
+            # Partial: most rows are unreleased (date_released NULL), and
+            # those lookups go through the composite indexes above; only
+            # queries over actual release dates need this one
+            models.Index(
+                fields=['date_released'],
+                condition=models.Q(date_released__isnull=False),
+                name='calling_released_idx',
+            ),
+            # Partial: scanning for rows still awaiting an LCR update is
+            # the only lcr_updated lookup, so don't index the synced bulk
+            models.Index(
+                fields=['lcr_updated'],
+                condition=models.Q(lcr_updated=False),
+                name='calling_lcr_pending_idx',
+            ),
+            models.Index(fields=['date_called'], name='calling_date_called_idx'),
+            # Matches the lookup key the import commands use to find an
+            # existing calling for a member in a given position
+            models.Index(
+                fields=['name', 'position', 'organization', 'unit'],
+                name='calling_import_key_idx',
+            ),
         ]
 
     def __str__(self):
@@ -232,6 +388,9 @@ class Calling(models.Model):
 
     def get_display_name(self):
         """Get the name with (N/R) suffix if release date is null or empty."""
+        # Served from the with_display_name annotation when present
+        if hasattr(self, 'display_name'):
+            return self.display_name
         if self.name:
             if not self.date_released:
                 return f"{self.name} (N/R)"
@@ -249,29 +408,62 @@ class Calling(models.Model):
         ]
 
     def get_absolute_url(self):
-        return reverse('callings:calling-detail', kwargs={'pk': self.pk})
+        return _detail_url_template('callings:calling-detail').format(pk=self.pk)
     
+    def build_search_text(self):
+        """Concatenate the searchable fields into one denormalized column."""
+        parts = (
+            self.name,
+            self.position.title if self.position_id else None,
+            self.organization.name if self.organization_id else None,
+            self.unit.name if self.unit_id else None,
+        )
+        return ' '.join(part for part in parts if part)
+
     def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        touched = set(update_fields) if update_fields is not None else None
+
         # Automatically update status to APPROVED when presidency_approved has a date
-        if self.presidency_approved and self.status == 'PENDING':
-            self.status = 'APPROVED'
-            
+        if touched is None or touched & {'status', 'presidency_approved'}:
+            if self.presidency_approved and self.status == 'PENDING':
+                self.status = 'APPROVED'
+                if touched is not None:
+                    touched.add('status')
+
+        # search_text only changes with the fields it is built from, so a
+        # narrowed save of anything else skips the rebuild and the write
+        if touched is None or touched & {'name', 'position', 'organization', 'unit'}:
+            self.search_text = self.build_search_text()
+            if touched is not None:
+                touched.add('search_text')
+
+        if touched is not None:
+            kwargs['update_fields'] = touched
         super().save(*args, **kwargs)
     
     # get_approval_status_class method removed - no longer needed without approval status fields
-    
+
+    # Built once at class load; list pages call get_status_badge_class for
+    # every rendered row
+    STATUS_BADGE_CLASSES = {
+        'PENDING': 'warning',
+        'APPROVED': 'success',
+        'IN_PROGRESS': 'primary',
+        'COMPLETED': 'success',
+        'CANCELLED': 'danger',
+        'ON_HOLD': 'warning',
+        'LCR_UPDATED': 'info',
+    }
+
     def get_status_badge_class(self):
         """Return CSS class for status badges"""
-        status_map = {
-            'PENDING': 'warning',
-            'APPROVED': 'success',
-            'IN_PROGRESS': 'primary',
-            'COMPLETED': 'success',
-            'CANCELLED': 'danger',
-            'ON_HOLD': 'warning',
-            'LCR_UPDATED': 'info',
-        }
-        return status_map.get(self.status, 'secondary')
+        return self.STATUS_BADGE_CLASSES.get(self.status, 'secondary')
+
+    def get_status_display(self):
+        # Same raw-value fallback for legacy statuses as the Django
+        # implementation, minus the per-call choices-dict rebuild
+        return self.STATUS_DISPLAY.get(self.status, self.status)
 
 
 class CallingHistory(models.Model):
@@ -299,7 +491,26 @@ class CallingHistory(models.Model):
         indexes = [
             models.Index(fields=['calling', '-changed_at'], name='history_calling_date_idx'),
             models.Index(fields=['action', '-changed_at'], name='history_action_date_idx'),
+            models.Index(fields=['changed_at'], name='history_changed_at_idx'),
+            # Per-user activity timelines (admin filter on changed_by)
+            models.Index(fields=['changed_by', '-changed_at'], name='history_user_date_idx'),
         ]
 
+    # Flattened once, as on Calling and Unit
+    ACTION_DISPLAY = dict(ACTION_CHOICES)
+
+    def get_action_display(self):
+        return self.ACTION_DISPLAY.get(self.action, self.action)
+
     def __str__(self):
         return f"{self.get_action_display()} - {self.calling} on {self.changed_at.strftime('%Y-%m-%d')}"
+
+    @classmethod
+    def log_many(cls, entries):
+        """Write a batch of history entries with one INSERT per 500 rows.
+
+        Callers recording history for many callings at once (imports, bulk
+        status changes) should build unsaved CallingHistory instances and
+        pass them here instead of creating them one at a time.
+        """
+        return cls.objects.bulk_create(entries, batch_size=500)
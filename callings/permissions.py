@@ -4,10 +4,9 @@ Custom permissions and decorators for CallingTrack.
 This module defines custom permissions for role-based access control
 and provides decorators/mixins for view protection.
 """
-from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.contrib.auth.views import redirect_to_login
 from django.core.exceptions import PermissionDenied
-from django.shortcuts import redirect
 from functools import wraps
 
 
@@ -19,9 +18,25 @@ STAKE_CLERK_GROUP = 'Stake Clerk'
 LEADERSHIP_GROUP = 'Leadership'
 
 
+def user_group_names(user):
+    """Return the user's group names as a set, cached on the user object.
+
+    A single request checks several roles (decorator, mixin, template),
+    and each used to issue its own EXISTS query. The request's user
+    object lives exactly as long as the request, so caching on it makes
+    every check after the first a set lookup with no invalidation to
+    manage.
+    """
+    cache = getattr(user, '_group_name_cache', None)
+    if cache is None:
+        cache = set(user.groups.values_list('name', flat=True))
+        user._group_name_cache = cache
+    return cache
+
+
 def user_in_group(user, group_name):
     """Check if user is in a specific group."""
-    return user.groups.filter(name=group_name).exists()
+    return group_name in user_group_names(user)
 
 
 def is_stake_president(user):
@@ -36,20 +51,15 @@ def is_bishop(user):
 
 def is_clerk(user):
     """Check if user is any kind of clerk."""
-    return (
-        user.is_superuser or 
-        user_in_group(user, CLERK_GROUP) or 
-        user_in_group(user, STAKE_CLERK_GROUP)
+    return user.is_superuser or bool(
+        {CLERK_GROUP, STAKE_CLERK_GROUP} & user_group_names(user)
     )
 
 
 def is_leadership(user):
     """Check if user is in any leadership position."""
-    return (
-        user.is_superuser or
-        user_in_group(user, STAKE_PRESIDENT_GROUP) or
-        user_in_group(user, BISHOP_GROUP) or
-        user_in_group(user, LEADERSHIP_GROUP)
+    return user.is_superuser or bool(
+        {STAKE_PRESIDENT_GROUP, BISHOP_GROUP, LEADERSHIP_GROUP} & user_group_names(user)
     )
 
 
@@ -74,59 +84,34 @@ def can_manage_units(user):
 
 
 # Decorators for function-based views
-def stake_president_required(view_func):
-    """Decorator to require stake president role."""
-    @wraps(view_func)
-    @login_required
-    def wrapper(request, *args, **kwargs):
-        if not is_stake_president(request.user):
-            raise PermissionDenied("Only Stake Presidents can access this page.")
-        return view_func(request, *args, **kwargs)
-    return wrapper
-
-
-def bishop_required(view_func):
-    """Decorator to require bishop role."""
-    @wraps(view_func)
-    @login_required
-    def wrapper(request, *args, **kwargs):
-        if not is_bishop(request.user):
-            raise PermissionDenied("Only Bishops can access this page.")
-        return view_func(request, *args, **kwargs)
-    return wrapper
-
-
-def leadership_required(view_func):
-    """Decorator to require any leadership role."""
-    @wraps(view_func)
-    @login_required
-    def wrapper(request, *args, **kwargs):
-        if not is_leadership(request.user):
-            raise PermissionDenied("Leadership access required.")
-        return view_func(request, *args, **kwargs)
-    return wrapper
-
-
-def clerk_required(view_func):
-    """Decorator to require clerk role."""
-    @wraps(view_func)
-    @login_required
-    def wrapper(request, *args, **kwargs):
-        if not is_clerk(request.user):
-            raise PermissionDenied("Clerk access required.")
-        return view_func(request, *args, **kwargs)
-    return wrapper
-
-
-def can_edit_required(view_func):
-    """Decorator to require calling edit permission."""
-    @wraps(view_func)
-    @login_required
-    def wrapper(request, *args, **kwargs):
-        if not can_edit_calling(request.user):
-            raise PermissionDenied("You don't have permission to edit callings.")
-        return view_func(request, *args, **kwargs)
-    return wrapper
+def role_required(check, message):
+    """Build a decorator enforcing login plus a role check in one frame.
+
+    The previous per-role decorators each stacked login_required around
+    their own wrapper, adding two frames per request; this runs both
+    checks in a single wrapper with the same redirect semantics.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not request.user.is_authenticated:
+                return redirect_to_login(request.get_full_path())
+            if not check(request.user):
+                raise PermissionDenied(message)
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+stake_president_required = role_required(
+    is_stake_president, "Only Stake Presidents can access this page."
+)
+bishop_required = role_required(is_bishop, "Only Bishops can access this page.")
+leadership_required = role_required(is_leadership, "Leadership access required.")
+clerk_required = role_required(is_clerk, "Clerk access required.")
+can_edit_required = role_required(
+    can_edit_calling, "You don't have permission to edit callings."
+)
 
 
 # Mixins for class-based views
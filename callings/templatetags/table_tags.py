@@ -1,64 +1,79 @@
-from django import template
-from django.utils.safestring import mark_safe
-from django.utils.html import format_html
-from urllib.parse import urlencode
-
-register = template.Library()
-
-@register.simple_tag(takes_context=True)
-def sort_header(context, field, label, default_order='asc'):
-    """
-    Generates a sortable table header link
-    """
-    request = context['request']
-    current_sort = request.GET.get('sort', '')
-    current_order = request.GET.get('order', 'asc')
-    
-    # Determine if this field is currently being sorted
-    is_active = current_sort == field
-    
-    # Determine the next order (toggle if active, use default if not)
-    if is_active:
-        next_order = 'desc' if current_order == 'asc' else 'asc'
-    else:
-        next_order = default_order
-    
-    # Build the query parameters
-    params = request.GET.copy()
-    params['sort'] = field
-    params['order'] = next_order
-    
-    # Create the URL
-    url = f"?{params.urlencode()}"
-    
-    # Determine the sort indicator icon
-    if is_active:
-        if current_order == 'asc':
-            icon = '<i class="fas fa-sort-up ms-1"></i>'
-        else:
-            icon = '<i class="fas fa-sort-down ms-1"></i>'
-    else:
-        icon = '<i class="fas fa-sort ms-1 text-muted"></i>'
-    
-    # Generate the HTML
-    html = format_html(
-        '<a href="{}" class="text-decoration-none text-dark d-flex align-items-center justify-content-between">'
-        '{}{}'
-        '</a>',
-        url,
-        label,
-        mark_safe(icon)
-    )
-    
-    return html
-
-@register.simple_tag(takes_context=True)
-def sort_url(context, field, order='asc'):
-    """
-    Generates a sort URL for a given field and order
-    """
-    request = context['request']
-    params = request.GET.copy()
-    params['sort'] = field
-    params['order'] = order
-    return f"?{params.urlencode()}"
+from django import template
+from django.utils.safestring import mark_safe
+from django.utils.html import format_html
+from urllib.parse import urlencode
+
+register = template.Library()
+
+@register.simple_tag(takes_context=True)
+def sort_header(context, field, label, default_order='asc'):
+    """
+    Generates a sortable table header link
+    """
+    request = context['request']
+
+    # Grouped tables render the same header row once per group, and the
+    # query string can't change mid-request, so cache the finished HTML
+    # on the request and skip the QueryDict copy + urlencode on repeats
+    cache = request.__dict__.setdefault('_sort_header_cache', {})
+    key = (field, label, default_order)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    current_sort = request.GET.get('sort', '')
+    current_order = request.GET.get('order', 'asc')
+
+    # Determine if this field is currently being sorted
+    is_active = current_sort == field
+
+    # Determine the next order (toggle if active, use default if not)
+    if is_active:
+        next_order = 'desc' if current_order == 'asc' else 'asc'
+    else:
+        next_order = default_order
+
+    # Build the query string directly instead of cloning the QueryDict
+    # just to overwrite two keys
+    items = [(k, values) for k, values in request.GET.lists() if k not in ('sort', 'order')]
+    items += [('sort', field), ('order', next_order)]
+    url = f"?{urlencode(items, doseq=True)}"
+
+    # Determine the sort indicator icon
+    if is_active:
+        if current_order == 'asc':
+            icon = '<i class="fas fa-sort-up ms-1"></i>'
+        else:
+            icon = '<i class="fas fa-sort-down ms-1"></i>'
+    else:
+        icon = '<i class="fas fa-sort ms-1 text-muted"></i>'
+
+    # Generate the HTML
+    html = format_html(
+        '<a href="{}" class="text-decoration-none text-dark d-flex align-items-center justify-content-between">'
+        '{}{}'
+        '</a>',
+        url,
+        label,
+        mark_safe(icon)
+    )
+
+    cache[key] = html
+    return html
+
+@register.simple_tag(takes_context=True)
+def sort_url(context, field, order='asc'):
+    """
+    Generates a sort URL for a given field and order
+    """
+    request = context['request']
+    # Same memoization as sort_header: the result is identical per request
+    cache = request.__dict__.setdefault('_sort_url_cache', {})
+    key = (field, order)
+    url = cache.get(key)
+    if url is None:
+        items = [(k, values) for k, values in request.GET.lists() if k not in ('sort', 'order')]
+        items += [('sort', field), ('order', order)]
+        url = f"?{urlencode(items, doseq=True)}"
+        cache[key] = url
+    return url
@@ -266,16 +266,16 @@ class TestOtherManagementCommands:
         # This will fail if command doesn't exist
         try:
             call_command('cleanup_members', '--help', stdout=StringIO())
-        except Exception as e:
-            # Command might not be fully implemented yet
+        except SystemExit:
+            # argparse exits after printing help - the command exists
             pass
             
     def test_import_callings_command_exists(self):
         """Test that import_callings command exists."""
         try:
             call_command('import_callings', '--help', stdout=StringIO())
-        except Exception as e:
-            # Command might not be fully implemented yet
+        except SystemExit:
+            # argparse exits after printing help - the command exists
             pass
 
 
@@ -299,3 +299,147 @@ class TestCommandErrorHandling:
         except Exception as e:
             # Command might fail, which is acceptable
             assert 'Permission' in str(e) or 'permission' in str(e)
+
+
+def _write_csv(path, header, rows, preamble_lines=2):
+    """Write an import fixture: preamble rows, a header row, then data."""
+    import csv as csv_module
+    with open(path, 'w', newline='') as f:
+        for _ in range(preamble_lines):
+            f.write('\n')
+        writer = csv_module.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+@pytest.mark.django_db
+class TestImportCallingsCommand:
+    """Round-trip tests for the import_callings command."""
+
+    HEADER = [
+        'Unit', 'Organization', 'Position', 'Currently Called', 'Notified',
+        'Date', 'Name', 'Home Unit', 'Presidency Approved', 'Bishop Consulted',
+        'HC Approved', 'Called By', 'Notified2', 'Sustained', 'Set Apart',
+        'LCR Updated',
+    ]
+
+    def _run(self, tmp_path, rows):
+        csv_file = tmp_path / 'callings.csv'
+        _write_csv(csv_file, self.HEADER, rows)
+        out = StringIO()
+        call_command('import_callings', str(csv_file), stdout=out)
+        return out.getvalue()
+
+    def test_creates_callings_with_parsed_fields(self, tmp_path):
+        """A data row creates a CALLED calling with dates, flags and search text."""
+        self._run(tmp_path, [
+            ['Test Ward', 'Elders Quorum', 'President', '', '',
+             '01/15/2024', 'John Smith', 'Test Ward', '01/10/2024', 'Bishop',
+             '01/12/2024', 'Stake President', '', '01/21/2024', '01/28/2024',
+             'TRUE'],
+        ])
+
+        calling = Calling.objects.get(name='John Smith')
+        assert calling.status == 'CALLED'
+        assert calling.unit.name == 'Test Ward'
+        assert calling.organization.name == 'Elders Quorum'
+        assert calling.position.title == 'President'
+        assert str(calling.date_called) == '2024-01-15'
+        assert str(calling.date_sustained) == '2024-01-21'
+        assert calling.lcr_updated is True
+        # bulk_create bypasses save(), so the command must fill this itself
+        assert 'John Smith' in calling.search_text
+        assert 'President' in calling.search_text
+
+    def test_release_then_duplicate_is_deduplicated(self, tmp_path):
+        """A release row marks the member RELEASED; re-calling the replacement is deduped."""
+        self._run(tmp_path, [
+            ['Test Ward', 'Elders Quorum', 'President', '', '',
+             '01/15/2024', 'John Smith', '', '', '', '', '', '', '', '', ''],
+            ['', '', 'President', 'John Smith', '',
+             '02/01/2024', 'Jane Doe', '', '', '', '', '', '', '', '', ''],
+            # Same member, same position again: already active, skipped
+            ['', '', 'President', '', '',
+             '02/01/2024', 'Jane Doe', '', '', '', '', '', '', '', '', ''],
+        ])
+
+        assert Calling.objects.get(name='John Smith').status == 'RELEASED'
+        jane = Calling.objects.filter(name='Jane Doe')
+        assert jane.count() == 1
+        assert jane.get().status == 'CALLED'
+
+    def test_recall_after_release_creates_fresh_row(self, tmp_path):
+        """Releasing a member frees the slot for a later row in the same file."""
+        self._run(tmp_path, [
+            ['Test Ward', 'Elders Quorum', 'President', '', '',
+             '01/15/2024', 'John Smith', '', '', '', '', '', '', '', '', ''],
+            ['', '', 'President', 'John Smith', '',
+             '', '', '', '', '', '', '', '', '', '', ''],
+            ['', '', 'President', '', '',
+             '03/01/2024', 'John Smith', '', '', '', '', '', '', '', '', ''],
+        ])
+
+        rows = Calling.objects.filter(name='John Smith').order_by('pk')
+        assert rows.count() == 2
+        assert [c.status for c in rows] == ['RELEASED', 'CALLED']
+
+
+@pytest.mark.django_db
+class TestImportCompletedCallingsCommand:
+    """Round-trip tests for the import_completed_callings command."""
+
+    HEADER = [
+        'Unit', 'Organization', 'Position', 'Currently Called', 'Released By',
+        'Date Released', 'Proposed Replacement', 'Home Unit', 'Date Approved',
+        'Bishop To Be Consulted By', 'Unused', 'Date Approved by HC',
+        'To Be Called By', 'Date Called', 'Sustained', 'Set Apart',
+        'LCR Updated',
+    ]
+
+    ROWS = [
+        ['Hillcrest Ward', 'Bishopric', 'Bishop', 'John Smith',
+         'Stake President', '06/15/2024', '', '', '06/18/2024', 'N/A', '',
+         '06/20/2024', 'Stake President', '01/15/2024', '01/21/2024',
+         '01/28/2024', 'true'],
+        ['', 'Elders Quorum', 'President', 'Mike Johnson', 'Bishop',
+         '05/10/2024', '', '', '05/13/2024', 'Bishop', '', '05/15/2024',
+         'Bishop', '02/01/2024', '02/07/2024', '02/14/2024', 'false'],
+        # No member: skipped
+        ['', 'Relief Society', 'President', 'vacant', '', '', '', '', '', '',
+         '', '', '', '', '', '', ''],
+    ]
+
+    def _run(self, tmp_path):
+        csv_file = tmp_path / 'completed.csv'
+        _write_csv(csv_file, self.HEADER, self.ROWS)
+        out = StringIO()
+        call_command('import_completed_callings', str(csv_file), stdout=out)
+        return out.getvalue()
+
+    def test_creates_completed_callings(self, tmp_path):
+        """Data rows create COMPLETED callings; skip rows are counted."""
+        output = self._run(tmp_path)
+
+        assert Calling.objects.count() == 2
+        assert Unit.objects.get(name='Hillcrest Ward').unit_type == 'WARD'
+
+        smith = Calling.objects.get(name='John Smith')
+        assert smith.status == 'COMPLETED'
+        assert smith.organization.name == 'Bishopric'
+        assert str(smith.date_released) == '2024-06-15'
+        assert str(smith.date_called) == '2024-01-15'
+        assert smith.lcr_updated is True
+        assert 'John Smith' in smith.search_text and 'Bishop' in smith.search_text
+
+        assert Calling.objects.get(name='Mike Johnson').lcr_updated is False
+        assert 'Callings created: 2' in output
+        assert 'no member name: 1' in output
+
+    def test_reimport_updates_in_place(self, tmp_path):
+        """Re-running the same file updates the existing rows instead of duplicating."""
+        self._run(tmp_path)
+        output = self._run(tmp_path)
+
+        assert Calling.objects.count() == 2
+        assert 'Callings created: 0' in output
+        assert 'Callings updated: 2' in output
@@ -0,0 +1,58 @@
+"""
+Tests for model-level helpers on the callings app.
+"""
+import pytest
+from callings.models import Calling, CallingHistory
+
+
+@pytest.mark.django_db
+class TestCallingQuerySetSetStatus:
+    """Tests for CallingQuerySet.set_status."""
+
+    def test_set_status_is_one_update_and_stamps_updated_at(
+        self, calling, django_assert_num_queries
+    ):
+        """set_status transitions rows in one UPDATE and sets updated_at itself."""
+        before = calling.updated_at
+
+        with django_assert_num_queries(1):
+            updated = Calling.objects.filter(pk=calling.pk).set_status('ON_HOLD')
+
+        assert updated == 1
+        calling.refresh_from_db()
+        assert calling.status == 'ON_HOLD'
+        # update() bypasses auto_now, so the method must write the stamp
+        assert calling.updated_at > before
+
+    def test_set_status_applies_extra_fields(self, calling):
+        """Extra columns ride along in the same UPDATE."""
+        Calling.objects.filter(pk=calling.pk).set_status('LCR_UPDATED', lcr_updated=True)
+
+        calling.refresh_from_db()
+        assert calling.status == 'LCR_UPDATED'
+        assert calling.lcr_updated is True
+
+
+@pytest.mark.django_db
+class TestCallingHistoryLogMany:
+    """Tests for CallingHistory.log_many."""
+
+    def test_log_many_writes_the_batch(self, calling, user):
+        """A batch of unsaved entries lands with fields and timestamps set."""
+        entries = [
+            CallingHistory(
+                calling=calling,
+                action='UPDATED',
+                member_name=calling.name,
+                changed_by=user,
+                snapshot={'status': calling.status},
+            )
+            for _ in range(3)
+        ]
+
+        created = CallingHistory.log_many(entries)
+
+        assert len(created) == 3
+        saved = CallingHistory.objects.filter(calling=calling, action='UPDATED')
+        assert saved.count() == 3
+        assert all(entry.changed_at is not None for entry in saved)
@@ -108,7 +108,9 @@ class TestPermissionHelpers:
         """Test user_in_group function."""
         assert user_in_group(regular_user, BISHOP_GROUP) is False
         regular_user.groups.add(bishop_group)
-        assert user_in_group(regular_user, BISHOP_GROUP) is True
+        # Membership is cached on the user object for its lifetime; a
+        # freshly loaded user (as each request gets) sees the new group
+        assert user_in_group(User.objects.get(pk=regular_user.pk), BISHOP_GROUP) is True
         
     def test_is_stake_president_superuser(self, superuser):
         """Test superuser is always stake president."""
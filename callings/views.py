@@ -80,8 +80,8 @@ def dashboard(request):
     
     # Get active callings (not COMPLETED, LCR_UPDATED, or CANCELLED)
     active_callings_queryset = Calling.objects.exclude(
-        status__in=['COMPLETED', 'LCR_UPDATED', 'CANCELLED']
-    ).select_related('position', 'unit', 'organization')
+        status__in=Calling.CLOSED_STATUSES
+    ).for_rendering()
     
     # If user has specific units assigned, filter by those
     if hasattr(request.user, 'units'):
@@ -149,7 +149,11 @@ class UnitListView(LoginRequiredMixin, TitleMixin, SortableMixin, ListView):
         'is_active': 'is_active',
         'sort_order': 'sort_order',
     }
-    
+
+    def get_queryset(self):
+        # get_list_display renders the parent unit name per row
+        return super().get_queryset().select_related('parent_unit')
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['headers'] = ['Name', 'Type', 'Parent Unit', 'Meeting Time', 'Status']
@@ -170,6 +174,16 @@ class UnitDetailView(LoginRequiredMixin, TitleMixin, DetailView):
     def get_title(self):
         return f"Unit: {self.get_object().name}"
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # Narrow the child-unit list to the columns the template renders
+        context['child_units'] = self.object.child_units.only('name', 'unit_type', 'meeting_time')
+        context['active_callings_count'] = self.object.callings.exclude(
+            status__in=Calling.CLOSED_STATUSES
+        ).count()
+        context['organization_count'] = self.object.organizations.count()
+        return context
+
 class UnitCreateView(LoginRequiredMixin, SuperuserRequiredMixin, TitleMixin, CreateView):
     model = Unit
     form_class = UnitForm
@@ -205,7 +219,12 @@ class OrganizationListView(LoginRequiredMixin, TitleMixin, ListView):
     context_object_name = 'organizations'
     title = 'Organizations'
     paginate_by = 20
-    
+
+    def get_queryset(self):
+        # get_list_display renders the unit name per row; the description
+        # is never listed
+        return super().get_queryset().select_related('unit').defer('description')
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['headers'] = ['Name', 'Unit', 'Leader', 'Status']
@@ -254,7 +273,12 @@ class PositionListView(LoginRequiredMixin, TitleMixin, ListView):
     context_object_name = 'positions'
     title = 'Positions'
     paginate_by = 20
-    
+
+    def get_queryset(self):
+        # get_list_display reads the current-holder annotation instead of
+        # issuing a query per rendered row; the description is never listed
+        return super().get_queryset().with_current_holder().defer('description')
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['headers'] = ['Title', 'Current Holder', 'Status']
@@ -268,6 +292,31 @@ class PositionDetailView(LoginRequiredMixin, TitleMixin, DetailView):
     def get_title(self):
         return f"Position: {self.get_object().title}"
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # One narrowed query serves both the current-holder card and the
+        # past-callings list; the wide text columns stay behind
+        callings = list(
+            self.object.callings
+            .defer('notes', 'release_notes', 'search_text')
+            .order_by('-date_called')
+        )
+        for calling in callings:
+            # They all belong to this position; prime the FK cache so the
+            # template doesn't fetch it once per row
+            calling.position = self.object
+        current_calling = next(
+            (calling for calling in callings
+             if calling.is_active and not calling.date_released
+             and calling.status not in Calling.INACTIVE_STATUSES),
+            None,
+        )
+        context['current_calling'] = current_calling
+        context['past_callings'] = [
+            calling for calling in callings if calling is not current_calling
+        ]
+        return context
+
 class PositionCreateView(LoginRequiredMixin, SuperuserRequiredMixin, TitleMixin, CreateView):
     model = Position
     form_class = PositionForm
@@ -305,7 +354,7 @@ class CallingListView(LoginRequiredMixin, TitleMixin, ListView):
     paginate_by = 20
     
     def get_queryset(self):
-        queryset = super().get_queryset().select_related('position', 'organization', 'unit')
+        queryset = super().get_queryset().for_rendering()
         
         # Search functionality
         search = self.request.GET.get('search')
@@ -335,7 +384,7 @@ class CallingListView(LoginRequiredMixin, TitleMixin, ListView):
             queryset = queryset.filter(status='ON_HOLD')
         elif status_filter == 'active':
             # Active calling is any calling not marked as COMPLETED, LCR_UPDATED, or CANCELLED
-            queryset = queryset.exclude(status__in=['COMPLETED', 'LCR_UPDATED', 'CANCELLED'])
+            queryset = queryset.exclude(status__in=Calling.CLOSED_STATUSES)
         elif status_filter == 'all':
             # Show all callings
             pass
@@ -375,7 +424,7 @@ class CallingListView(LoginRequiredMixin, TitleMixin, ListView):
         context = super().get_context_data(**kwargs)
         
         # Get all callings for counts (before filtering)
-        all_callings = Calling.objects.select_related('position', 'organization', 'unit')
+        all_callings = Calling.objects.with_display()
         
         # Apply search to counts if search is active
         search = self.request.GET.get('search')
@@ -396,7 +445,7 @@ class CallingListView(LoginRequiredMixin, TitleMixin, ListView):
         context['cancelled_count'] = all_callings.filter(status='CANCELLED').count()
         context['on_hold_count'] = all_callings.filter(status='ON_HOLD').count()
         # Use new Active definition: not COMPLETED, LCR_UPDATED, or CANCELLED
-        context['active_count'] = all_callings.exclude(status__in=['COMPLETED', 'LCR_UPDATED', 'CANCELLED']).count()
+        context['active_count'] = all_callings.exclude(status__in=Calling.CLOSED_STATUSES).count()
         context['all_count'] = all_callings.count()
         
         # Current filter for template
@@ -414,7 +463,7 @@ class CallingsByUnitView(LoginRequiredMixin, TitleMixin, ListView):
     paginate_by = None  # Show all for grouping
     
     def get_queryset(self):
-        queryset = super().get_queryset().select_related('position', 'organization', 'unit')
+        queryset = super().get_queryset().for_rendering()
         
         # Search functionality
         search = self.request.GET.get('search')
@@ -444,7 +493,7 @@ class CallingsByUnitView(LoginRequiredMixin, TitleMixin, ListView):
             queryset = queryset.filter(status='ON_HOLD')
         elif status_filter == 'active':
             # Active calling is any calling not marked as COMPLETED, LCR_UPDATED, or CANCELLED
-            queryset = queryset.exclude(status__in=['COMPLETED', 'LCR_UPDATED', 'CANCELLED'])
+            queryset = queryset.exclude(status__in=Calling.CLOSED_STATUSES)
         elif status_filter == 'all':
             pass
         else:
@@ -481,22 +530,16 @@ class CallingsByUnitView(LoginRequiredMixin, TitleMixin, ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Group callings by unit
+        # Group callings by unit. The queryset is already ordered by
+        # unit__sort_order then unit__name, so grouping in encounter order
+        # yields sorted groups without a second Python-side sort.
         callings_by_unit = {}
-        unit_objects = {}
         for calling in context['callings']:
-            unit_name = str(calling.unit)
-            if unit_name not in callings_by_unit:
-                callings_by_unit[unit_name] = []
-                unit_objects[unit_name] = calling.unit
-            callings_by_unit[unit_name].append(calling)
-        
-        # Sort by unit sort_order, then by name
-        sorted_units = sorted(unit_objects.items(), key=lambda x: (x[1].sort_order, x[1].name))
-        context['callings_by_unit'] = {unit_name: callings_by_unit[unit_name] for unit_name, unit_obj in sorted_units}
-        
+            callings_by_unit.setdefault(str(calling.unit), []).append(calling)
+        context['callings_by_unit'] = callings_by_unit
+
         # Get counts (reuse logic from CallingListView)
-        all_callings = Calling.objects.select_related('position', 'organization', 'unit')
+        all_callings = Calling.objects.with_display()
         search = self.request.GET.get('search')
         if search:
             all_callings = all_callings.filter(
@@ -514,7 +557,7 @@ class CallingsByUnitView(LoginRequiredMixin, TitleMixin, ListView):
         context['cancelled_count'] = all_callings.filter(status='CANCELLED').count()
         context['on_hold_count'] = all_callings.filter(status='ON_HOLD').count()
         # Use new Active definition: not COMPLETED, LCR_UPDATED, or CANCELLED
-        context['active_count'] = all_callings.exclude(status__in=['COMPLETED', 'LCR_UPDATED', 'CANCELLED']).count()
+        context['active_count'] = all_callings.exclude(status__in=Calling.CLOSED_STATUSES).count()
         context['all_count'] = all_callings.count()
         
         context['current_status'] = self.request.GET.get('status', 'all')
@@ -527,9 +570,13 @@ class CallingDetailView(LoginRequiredMixin, TitleMixin, DetailView):
     template_name = 'callings/calling/calling_detail.html'
     context_object_name = 'calling'
 
+    def get_queryset(self):
+        # The template also renders the member's home unit
+        return super().get_queryset().with_display().select_related('home_unit')
+
     def get_title(self):
         return f"Calling: {self.get_object().position.title}"
-    
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['release_form'] = CallingReleaseForm(instance=self.object)
@@ -681,8 +728,9 @@ class CallingUpdateStatusView(LoginRequiredMixin, SuperuserRequiredMixin, View):
         calling = get_object_or_404(Calling, pk=pk)
         old_status = calling.get_status_display()
         calling.status = new_status
-        calling.save()
-        
+        # Only the status changed; don't rewrite the whole row
+        calling.save(update_fields=['status', 'updated_at'])
+
         new_status_display = calling.get_status_display()
         messages.success(request, f'Calling status updated from {old_status} to {new_status_display} successfully.')
         
@@ -737,7 +785,7 @@ class CallingLCRUpdateView(LoginRequiredMixin, SuperuserRequiredMixin, TitleMixi
         # Update the status to LCR_UPDATED
         calling.status = 'LCR_UPDATED'
         calling.lcr_updated = True
-        calling.save()
+        calling.save(update_fields=['status', 'lcr_updated', 'updated_at'])
         
         messages.success(request, f'LCR status updated for {calling.position.title} calling.')
         
@@ -88,7 +88,12 @@ WSGI_APPLICATION = 'callingtrack.wsgi.application'
 # Heroku automatically provides DATABASE_URL
 DATABASES = {
     'default': dj_database_url.config(
-        default=config('DATABASE_URL', default=f'sqlite:///{BASE_DIR / "db.sqlite3"}')
+        default=config('DATABASE_URL', default=f'sqlite:///{BASE_DIR / "db.sqlite3"}'),
+        # Keep connections open between requests instead of paying the
+        # TCP + auth handshake on every one; health checks recycle
+        # connections the server has dropped in the meantime
+        conn_max_age=600,
+        conn_health_checks=True,
     )
 }
 